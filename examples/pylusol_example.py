@@ -63,29 +63,15 @@ def example_sparse_matrix():
     
     # Create a larger sparse matrix
     n = 10
-    data = []
-    row = []
-    col = []
-    
-    # Tridiagonal matrix
-    for i in range(n):
-        # Diagonal
-        data.append(4.0)
-        row.append(i)
-        col.append(i)
-        
-        # Upper diagonal
-        if i < n - 1:
-            data.append(-1.0)
-            row.append(i)
-            col.append(i + 1)
-        
-        # Lower diagonal
-        if i > 0:
-            data.append(-1.0)
-            row.append(i)
-            col.append(i - 1)
-    
+
+    # Tridiagonal matrix, built with vectorized NumPy operations
+    # instead of a Python append loop
+    diag = np.arange(n)
+    off = np.arange(n - 1)
+    row = np.concatenate([diag, off, off + 1])
+    col = np.concatenate([diag, off + 1, off])
+    data = np.concatenate([np.full(n, 4.0), np.full(2 * (n - 1), -1.0)])
+
     A = csr_matrix((data, (row, col)), shape=(n, n))
     print(f"Created {n}x{n} tridiagonal matrix")
     print(f"Number of nonzeros: {A.nnz}")
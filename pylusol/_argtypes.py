@@ -0,0 +1,15 @@
+"""Generated by setup.py from src/clusol.h -- do not edit"""
+
+SIGS = {
+    "clu1fac": "iiiiPddPPPPPPPPPPPPdi",
+    "clu6mul": "iiiddiPddPPPPPPPP",
+    "clu6sol": "iiiddiPddPPPPPPPPi",
+    "clu6sol_batch": "iiiiddiPddPPPPPPPPi",
+    "clu8adc": "iiiddiPddPPPPPPPPixx",
+    "clu8adr": "iidiPddPPPPPPPPix",
+    "clu8dlc": "iiiiPddPPPPPPPPi",
+    "clu8dlr": "iiiiddiPddPPPPPPPPi",
+    "clu8mod": "iiixddiPddPPPPPPPPi",
+    "clu8rpc": "iiiiiddiPddPPPPPPPPixx",
+    "clu8rpr": "iiiiidddiPddPPPPPPPPi",
+}
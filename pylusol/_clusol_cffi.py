@@ -0,0 +1,159 @@
+"""
+Optional CFFI ABI-mode binding to the hot LUSOL entry points
+
+CFFI's call path marshals arguments noticeably faster than ctypes, so
+this module is the middle tier of the binding ladder: lusol.py prefers
+the compiled Cython module, falls back to this one when only cffi is
+available, and uses ctypes otherwise. It exposes the same Python
+signatures as _clusol_cy, so the call sites do not care which of the
+two they got. Importing it without cffi installed raises ImportError,
+which lusol.py treats as "not available".
+"""
+
+from cffi import FFI
+
+from .clusol import _find_library
+
+ffi = FFI()
+
+# ABI-mode declarations for the entry points this module wraps; the
+# full interface (with argument documentation) is src/clusol.h.
+ffi.cdef("""
+void clu1fac(
+  int64_t* m, int64_t* n, int64_t* nelem, int64_t* lena,
+  int64_t* luparm, double* parmlu, double* a,
+  int64_t* indc, int64_t* indr, int64_t* p, int64_t* q,
+  int64_t* lenc, int64_t* lenr, int64_t* locc, int64_t* locr,
+  int64_t* iploc, int64_t* iqloc, int64_t* ipinv, int64_t* iqinv,
+  double* w, int64_t* inform);
+void clu6sol(
+  int64_t* mode, int64_t* m, int64_t* n, double* v, double* w,
+  int64_t* lena, int64_t* luparm, double* parmlu, double* a,
+  int64_t* indc, int64_t* indr, int64_t* p, int64_t* q,
+  int64_t* lenc, int64_t* lenr, int64_t* locc, int64_t* locr,
+  int64_t* inform);
+void clu6mul(
+  int64_t* mode, int64_t* m, int64_t* n, double* v, double* w,
+  int64_t* lena, int64_t* luparm, double* parmlu, double* a,
+  int64_t* indc, int64_t* indr, int64_t* p, int64_t* q,
+  int64_t* lenc, int64_t* lenr, int64_t* locc, int64_t* locr);
+void clu8rpc(
+  int64_t* mode1, int64_t* mode2, int64_t* m, int64_t* n,
+  int64_t* jrep, double* v, double* w,
+  int64_t* lena, int64_t* luparm, double* parmlu, double* a,
+  int64_t* indc, int64_t* indr, int64_t* p, int64_t* q,
+  int64_t* lenc, int64_t* lenr, int64_t* locc, int64_t* locr,
+  int64_t* inform, double* diag, double* vnorm);
+""")
+
+# Handle to the library, loaded lazily on first call: an eager dlopen
+# would make a checkout without libclusol fail at import (with an
+# OSError the backend ladder in lusol.py does not treat as "module
+# unavailable") instead of at first construction like the other tiers
+_lib = None
+
+
+def _get_lib():
+    global _lib
+    if _lib is None:
+        _lib = ffi.dlopen(_find_library())
+    return _lib
+
+
+def _pi(arr):
+    """int64_t* over a NumPy array's data (no copy, no validation)"""
+    return ffi.cast('int64_t *', arr.ctypes.data)
+
+
+def _pd(arr):
+    """double* over a NumPy array's data (no copy, no validation)"""
+    return ffi.cast('double *', arr.ctypes.data)
+
+
+def clu1fac(m, n, nelem, lena, luparm, parmlu, a,
+            indc, indr, p, q, lenc, lenr, locc, locr,
+            iploc, iqloc, ipinv, iqinv, w):
+    """Factorize; returns inform"""
+    inform = ffi.new('int64_t *')
+    lib = _get_lib()
+    lib.clu1fac(ffi.new('int64_t *', m), ffi.new('int64_t *', n),
+                ffi.new('int64_t *', nelem), ffi.new('int64_t *', lena),
+                _pi(luparm), _pd(parmlu), _pd(a),
+                _pi(indc), _pi(indr), _pi(p), _pi(q),
+                _pi(lenc), _pi(lenr), _pi(locc), _pi(locr),
+                _pi(iploc), _pi(iqloc), _pi(ipinv), _pi(iqinv),
+                _pd(w), inform)
+    return inform[0]
+
+
+def clu6sol(mode, m, n, v, w, lena, luparm, parmlu, a,
+            indc, indr, p, q, lenc, lenr, locc, locr):
+    """Solve with the factors; returns inform"""
+    inform = ffi.new('int64_t *')
+    lib = _get_lib()
+    lib.clu6sol(ffi.new('int64_t *', mode), ffi.new('int64_t *', m),
+                ffi.new('int64_t *', n), _pd(v), _pd(w),
+                ffi.new('int64_t *', lena),
+                _pi(luparm), _pd(parmlu), _pd(a),
+                _pi(indc), _pi(indr), _pi(p), _pi(q),
+                _pi(lenc), _pi(lenr), _pi(locc), _pi(locr), inform)
+    return inform[0]
+
+
+def clu6sol_many(mode, m, n, V, W, lena, luparm, parmlu, a,
+                 indc, indr, p, q, lenc, lenr, locc, locr):
+    """Solve the systems stored in the rows of V/W; returns inform
+
+    The per-right-hand-side loop stays in Python here (unlike the
+    Cython version), but each iteration pays only the cheap CFFI call.
+    Stops at the first nonzero inform.
+    """
+    lib = _get_lib()
+    c_mode = ffi.new('int64_t *', mode)
+    c_m = ffi.new('int64_t *', m)
+    c_n = ffi.new('int64_t *', n)
+    c_lena = ffi.new('int64_t *', lena)
+    inform = ffi.new('int64_t *')
+    args = (_pi(luparm), _pd(parmlu), _pd(a),
+            _pi(indc), _pi(indr), _pi(p), _pi(q),
+            _pi(lenc), _pi(lenr), _pi(locc), _pi(locr), inform)
+    vstride, wstride = V.strides[0], W.strides[0]
+    vbase, wbase = V.ctypes.data, W.ctypes.data
+    for j in range(V.shape[0]):
+        lib.clu6sol(c_mode, c_m, c_n,
+                    ffi.cast('double *', vbase + j * vstride),
+                    ffi.cast('double *', wbase + j * wstride),
+                    c_lena, *args)
+        if inform[0] != 0:
+            break
+    return inform[0]
+
+
+def clu6mul(mode, m, n, v, w, lena, luparm, parmlu, a,
+            indc, indr, p, q, lenc, lenr, locc, locr):
+    """Multiply by the factors"""
+    lib = _get_lib()
+    lib.clu6mul(ffi.new('int64_t *', mode), ffi.new('int64_t *', m),
+                ffi.new('int64_t *', n), _pd(v), _pd(w),
+                ffi.new('int64_t *', lena),
+                _pi(luparm), _pd(parmlu), _pd(a),
+                _pi(indc), _pi(indr), _pi(p), _pi(q),
+                _pi(lenc), _pi(lenr), _pi(locc), _pi(locr))
+
+
+def clu8rpc(mode1, mode2, m, n, jrep, v, w, lena, luparm, parmlu, a,
+            indc, indr, p, q, lenc, lenr, locc, locr):
+    """Replace a column of the factors; returns (inform, diag, vnorm)"""
+    inform = ffi.new('int64_t *')
+    diag = ffi.new('double *')
+    vnorm = ffi.new('double *')
+    lib = _get_lib()
+    lib.clu8rpc(ffi.new('int64_t *', mode1), ffi.new('int64_t *', mode2),
+                ffi.new('int64_t *', m), ffi.new('int64_t *', n),
+                ffi.new('int64_t *', jrep), _pd(v), _pd(w),
+                ffi.new('int64_t *', lena),
+                _pi(luparm), _pd(parmlu), _pd(a),
+                _pi(indc), _pi(indr), _pi(p), _pi(q),
+                _pi(lenc), _pi(lenr), _pi(locc), _pi(locr),
+                inform, diag, vnorm)
+    return inform[0], diag[0], vnorm[0]
@@ -0,0 +1,170 @@
+# cython: boundscheck=False, wraparound=False, language_level=3
+"""
+Optional Cython binding to the hot LUSOL entry points
+
+ctypes marshals ~20 arguments per call, which dominates repeated
+small-matrix solves. These wrappers take typed memoryviews over the
+same NumPy workspaces the ctypes path uses and call the C symbols
+directly, releasing the GIL around the call. lusol.py prefers this
+module when it has been built (see setup.py); the ctypes path remains
+the fallback, so building it is optional.
+"""
+
+from cython.parallel import prange
+from libc.stdint cimport int64_t
+
+
+cdef extern from "clusol.h":
+    void c_clu1fac "clu1fac"(
+        int64_t* m, int64_t* n, int64_t* nelem, int64_t* lena,
+        int64_t* luparm, double* parmlu, double* a,
+        int64_t* indc, int64_t* indr, int64_t* p, int64_t* q,
+        int64_t* lenc, int64_t* lenr, int64_t* locc, int64_t* locr,
+        int64_t* iploc, int64_t* iqloc, int64_t* ipinv, int64_t* iqinv,
+        double* w, int64_t* inform) nogil
+    void c_clu6sol "clu6sol"(
+        int64_t* mode, int64_t* m, int64_t* n, double* v, double* w,
+        int64_t* lena, int64_t* luparm, double* parmlu, double* a,
+        int64_t* indc, int64_t* indr, int64_t* p, int64_t* q,
+        int64_t* lenc, int64_t* lenr, int64_t* locc, int64_t* locr,
+        int64_t* inform) nogil
+    void c_clu6mul "clu6mul"(
+        int64_t* mode, int64_t* m, int64_t* n, double* v, double* w,
+        int64_t* lena, int64_t* luparm, double* parmlu, double* a,
+        int64_t* indc, int64_t* indr, int64_t* p, int64_t* q,
+        int64_t* lenc, int64_t* lenr, int64_t* locc, int64_t* locr) nogil
+    void c_clu8rpc "clu8rpc"(
+        int64_t* mode1, int64_t* mode2, int64_t* m, int64_t* n,
+        int64_t* jrep, double* v, double* w,
+        int64_t* lena, int64_t* luparm, double* parmlu, double* a,
+        int64_t* indc, int64_t* indr, int64_t* p, int64_t* q,
+        int64_t* lenc, int64_t* lenr, int64_t* locc, int64_t* locr,
+        int64_t* inform, double* diag, double* vnorm) nogil
+
+
+def clu1fac(int64_t m, int64_t n, int64_t nelem, int64_t lena,
+            int64_t[::1] luparm, double[::1] parmlu, double[::1] a,
+            int64_t[::1] indc, int64_t[::1] indr,
+            int64_t[::1] p, int64_t[::1] q,
+            int64_t[::1] lenc, int64_t[::1] lenr,
+            int64_t[::1] locc, int64_t[::1] locr,
+            int64_t[::1] iploc, int64_t[::1] iqloc,
+            int64_t[::1] ipinv, int64_t[::1] iqinv,
+            double[::1] w):
+    """Factorize; returns inform"""
+    cdef int64_t inform = 0
+    with nogil:
+        c_clu1fac(&m, &n, &nelem, &lena,
+                  &luparm[0], &parmlu[0], &a[0],
+                  &indc[0], &indr[0], &p[0], &q[0],
+                  &lenc[0], &lenr[0], &locc[0], &locr[0],
+                  &iploc[0], &iqloc[0], &ipinv[0], &iqinv[0],
+                  &w[0], &inform)
+    return inform
+
+
+def clu6sol(int64_t mode, int64_t m, int64_t n,
+            double[::1] v, double[::1] w, int64_t lena,
+            int64_t[::1] luparm, double[::1] parmlu, double[::1] a,
+            int64_t[::1] indc, int64_t[::1] indr,
+            int64_t[::1] p, int64_t[::1] q,
+            int64_t[::1] lenc, int64_t[::1] lenr,
+            int64_t[::1] locc, int64_t[::1] locr):
+    """Solve with the factors; returns inform"""
+    cdef int64_t inform = 0
+    with nogil:
+        c_clu6sol(&mode, &m, &n, &v[0], &w[0], &lena,
+                  &luparm[0], &parmlu[0], &a[0],
+                  &indc[0], &indr[0], &p[0], &q[0],
+                  &lenc[0], &lenr[0], &locc[0], &locr[0], &inform)
+    return inform
+
+
+def clu6sol_many(int64_t mode, int64_t m, int64_t n,
+                 double[:, ::1] V, double[:, ::1] W, int64_t lena,
+                 int64_t[::1] luparm, double[::1] parmlu, double[::1] a,
+                 int64_t[::1] indc, int64_t[::1] indr,
+                 int64_t[::1] p, int64_t[::1] q,
+                 int64_t[::1] lenc, int64_t[::1] lenr,
+                 int64_t[::1] locc, int64_t[::1] locr):
+    """Solve the systems stored in the rows of V/W; returns inform
+
+    The loop over right-hand sides runs under nogil, so k solves cost
+    one Python call. Stops at the first nonzero inform.
+    """
+    cdef int64_t inform = 0
+    cdef Py_ssize_t j
+    cdef Py_ssize_t nrhs = V.shape[0]
+    with nogil:
+        for j in range(nrhs):
+            c_clu6sol(&mode, &m, &n, &V[j, 0], &W[j, 0], &lena,
+                      &luparm[0], &parmlu[0], &a[0],
+                      &indc[0], &indr[0], &p[0], &q[0],
+                      &lenc[0], &lenr[0], &locc[0], &locr[0], &inform)
+            if inform != 0:
+                break
+    return inform
+
+
+def clu6sol_many_parallel(int64_t mode, int64_t m, int64_t n,
+                          double[:, ::1] V, double[:, ::1] W, int64_t lena,
+                          int64_t[::1] luparm, double[::1] parmlu,
+                          double[::1] a,
+                          int64_t[::1] indc, int64_t[::1] indr,
+                          int64_t[::1] p, int64_t[::1] q,
+                          int64_t[::1] lenc, int64_t[::1] lenr,
+                          int64_t[::1] locc, int64_t[::1] locr,
+                          int64_t[::1] informs):
+    """Solve the systems in the rows of V/W across OpenMP threads
+
+    Each right-hand side owns its V/W row and the factor data itself is
+    only read, so the numerical results are independent; per-column
+    inform codes land in informs for the caller to inspect. The solves
+    do race on two diagnostic slots -- lu6U stores its return code and
+    condition estimate into luparm(10)/parmlu(20) on every call -- so
+    after a parallel batch those slots hold the values from whichever
+    column happened to finish last. Without OpenMP support at build
+    time the loop degrades to serial.
+    """
+    cdef Py_ssize_t j
+    cdef Py_ssize_t nrhs = V.shape[0]
+    for j in prange(nrhs, nogil=True, schedule='static'):
+        c_clu6sol(&mode, &m, &n, &V[j, 0], &W[j, 0], &lena,
+                  &luparm[0], &parmlu[0], &a[0],
+                  &indc[0], &indr[0], &p[0], &q[0],
+                  &lenc[0], &lenr[0], &locc[0], &locr[0], &informs[j])
+
+
+def clu6mul(int64_t mode, int64_t m, int64_t n,
+            double[::1] v, double[::1] w, int64_t lena,
+            int64_t[::1] luparm, double[::1] parmlu, double[::1] a,
+            int64_t[::1] indc, int64_t[::1] indr,
+            int64_t[::1] p, int64_t[::1] q,
+            int64_t[::1] lenc, int64_t[::1] lenr,
+            int64_t[::1] locc, int64_t[::1] locr):
+    """Multiply by the factors"""
+    with nogil:
+        c_clu6mul(&mode, &m, &n, &v[0], &w[0], &lena,
+                  &luparm[0], &parmlu[0], &a[0],
+                  &indc[0], &indr[0], &p[0], &q[0],
+                  &lenc[0], &lenr[0], &locc[0], &locr[0])
+
+
+def clu8rpc(int64_t mode1, int64_t mode2, int64_t m, int64_t n,
+            int64_t jrep, double[::1] v, double[::1] w, int64_t lena,
+            int64_t[::1] luparm, double[::1] parmlu, double[::1] a,
+            int64_t[::1] indc, int64_t[::1] indr,
+            int64_t[::1] p, int64_t[::1] q,
+            int64_t[::1] lenc, int64_t[::1] lenr,
+            int64_t[::1] locc, int64_t[::1] locr):
+    """Replace a column of the factors; returns (inform, diag, vnorm)"""
+    cdef int64_t inform = 0
+    cdef double diag = 0.0
+    cdef double vnorm = 0.0
+    with nogil:
+        c_clu8rpc(&mode1, &mode2, &m, &n, &jrep, &v[0], &w[0], &lena,
+                  &luparm[0], &parmlu[0], &a[0],
+                  &indc[0], &indr[0], &p[0], &q[0],
+                  &lenc[0], &lenr[0], &locc[0], &locr[0],
+                  &inform, &diag, &vnorm)
+    return inform, diag, vnorm
@@ -0,0 +1,72 @@
+"""
+Optional Numba integration helpers for hot solve loops
+
+Numba's nopython mode can call ctypes functions whose argtypes/restype
+are configured, but the ndpointer argtypes used by pylusol.clusol are
+not understood by Numba. This module exposes raw function addresses and
+plain-pointer CFUNCTYPE handles for the hot LUSOL entry points so that
+users running many small solves (Krylov inner loops, simplex pivoting)
+can invoke them from @njit code with no Python round-trip per call.
+
+Numba itself is not a pylusol dependency; importing this module only
+requires it when a Numba-callable handle is requested. Note the usual
+JIT caveat: the first call into an @njit function pays compilation cost,
+so this path only wins on repeated solves.
+
+Example
+-------
+>>> from pylusol._jit import cfunc_handle
+>>> clu6sol = cfunc_handle('clu6sol')   # callable from @njit code
+"""
+
+import ctypes
+from .clusol import _get_clusol, _SIGS
+
+c_int64_p = ctypes.POINTER(ctypes.c_int64)
+c_double_p = ctypes.POINTER(ctypes.c_double)
+
+
+def function_address(name):
+    """
+    Return the raw address of a LUSOL entry point
+
+    Parameters
+    ----------
+    name : str
+        Entry point name, e.g. 'clu6sol'
+
+    Returns
+    -------
+    addr : int
+        Address of the C function in the loaded library
+    """
+    if name not in _SIGS:
+        raise ValueError(f"Unknown LUSOL entry point: {name}")
+    lib = _get_clusol()
+    return ctypes.cast(getattr(lib, name), ctypes.c_void_p).value
+
+
+def cfunc_handle(name):
+    """
+    Return a plain-pointer CFUNCTYPE handle for a LUSOL entry point
+
+    The handle uses POINTER(c_int64)/POINTER(c_double) argument types
+    for every slot (no ndpointer), which Numba's nopython mode accepts
+    directly. The caller is responsible for passing valid pointers,
+    e.g. array.ctypes.data_as(...) or Numba-side pointer arithmetic.
+
+    Parameters
+    ----------
+    name : str
+        Entry point name, e.g. 'clu6sol'
+
+    Returns
+    -------
+    fn : ctypes function
+        CFUNCTYPE-wrapped function usable inside @njit code
+    """
+    if name not in _SIGS:
+        raise ValueError(f"Unknown LUSOL entry point: {name}")
+    argtypes = [c_int64_p if c in 'Pi' else c_double_p for c in _SIGS[name]]
+    proto = ctypes.CFUNCTYPE(None, *argtypes)
+    return proto(function_address(name))
@@ -5,12 +5,14 @@ This module provides direct Python bindings to the C interface of LUSOL.
 """
 
 import ctypes
+import functools
 import os
 import platform
 import numpy as np
 from numpy.ctypeslib import ndpointer
 
 
+@functools.lru_cache(maxsize=1)
 def _find_library():
     """Find the LUSOL shared library"""
     # Determine library name based on platform
@@ -25,9 +27,13 @@ def _find_library():
         raise OSError(f"Unsupported platform: {system}")
     
     # Search paths for the library
+    pkg_lib = os.path.join(os.path.dirname(__file__), 'lib')
     search_paths = [
+        # Per-architecture bundled library (e.g. lib/linux_x86_64), so
+        # one wheel/checkout can carry builds for several machines
+        os.path.join(pkg_lib, f'{system.lower()}_{platform.machine()}'),
         # Pre-compiled library bundled with the package
-        os.path.join(os.path.dirname(__file__), 'lib'),
+        pkg_lib,
         # Directory relative to this file (for development builds)
         os.path.join(os.path.dirname(__file__), '..', 'src'),
         os.path.join(os.path.dirname(__file__), '..', 'matlab'),
@@ -45,265 +51,99 @@ def _find_library():
     return lib_name
 
 
-# Load the LUSOL C library
-_lib_path = _find_library()
-_clusol = ctypes.CDLL(_lib_path)
+# Handle to the LUSOL C library, loaded lazily on first use
+_clusol = None
 
 
-# Define ctypes for int64_t* and double*
-c_int64_p = ctypes.POINTER(ctypes.c_int64)
-c_double_p = ctypes.POINTER(ctypes.c_double)
-
-
-# clu1fac: LU factorization
-_clusol.clu1fac.argtypes = [
-    c_int64_p,  # m
-    c_int64_p,  # n
-    c_int64_p,  # nelem
-    c_int64_p,  # lena
-    c_int64_p,  # luparm
-    c_double_p, # parmlu
-    c_double_p, # a
-    c_int64_p,  # indc
-    c_int64_p,  # indr
-    c_int64_p,  # p
-    c_int64_p,  # q
-    c_int64_p,  # lenc
-    c_int64_p,  # lenr
-    c_int64_p,  # locc
-    c_int64_p,  # locr
-    c_int64_p,  # iploc
-    c_int64_p,  # iqloc
-    c_int64_p,  # ipinv
-    c_int64_p,  # iqinv
-    c_double_p, # w
-    c_int64_p,  # inform
-]
-_clusol.clu1fac.restype = None
-
-
-# clu6sol: Solve with LU factors
-_clusol.clu6sol.argtypes = [
-    c_int64_p,  # mode
-    c_int64_p,  # m
-    c_int64_p,  # n
-    c_double_p, # v
-    c_double_p, # w
-    c_int64_p,  # lena
-    c_int64_p,  # luparm
-    c_double_p, # parmlu
-    c_double_p, # a
-    c_int64_p,  # indc
-    c_int64_p,  # indr
-    c_int64_p,  # p
-    c_int64_p,  # q
-    c_int64_p,  # lenc
-    c_int64_p,  # lenr
-    c_int64_p,  # locc
-    c_int64_p,  # locr
-    c_int64_p,  # inform
-]
-_clusol.clu6sol.restype = None
-
-
-# clu8rpc: Replace column
-_clusol.clu8rpc.argtypes = [
-    c_int64_p,  # mode1
-    c_int64_p,  # mode2
-    c_int64_p,  # m
-    c_int64_p,  # n
-    c_int64_p,  # jrep
-    c_double_p, # v
-    c_double_p, # w
-    c_int64_p,  # lena
-    c_int64_p,  # luparm
-    c_double_p, # parmlu
-    c_double_p, # a
-    c_int64_p,  # indc
-    c_int64_p,  # indr
-    c_int64_p,  # p
-    c_int64_p,  # q
-    c_int64_p,  # lenc
-    c_int64_p,  # lenr
-    c_int64_p,  # locc
-    c_int64_p,  # locr
-    c_int64_p,  # inform
-    c_double_p, # diag
-    c_double_p, # vnorm
-]
-_clusol.clu8rpc.restype = None
-
-
-# clu6mul: Multiply with LU factors
-_clusol.clu6mul.argtypes = [
-    c_int64_p,  # mode
-    c_int64_p,  # m
-    c_int64_p,  # n
-    c_double_p, # v
-    c_double_p, # w
-    c_int64_p,  # lena
-    c_int64_p,  # luparm
-    c_double_p, # parmlu
-    c_double_p, # a
-    c_int64_p,  # indc
-    c_int64_p,  # indr
-    c_int64_p,  # p
-    c_int64_p,  # q
-    c_int64_p,  # lenc
-    c_int64_p,  # lenr
-    c_int64_p,  # locc
-    c_int64_p,  # locr
-]
-_clusol.clu6mul.restype = None
+def _get_clusol():
+    """Load the LUSOL C library on first use and return the handle
 
+    The library load (filesystem search + dlopen) is deferred until the
+    first LUSOL object is constructed, so that `import pylusol` stays
+    cheap. The returned handle is the raw CDLL; callers should access
+    the entry points as attributes of this module (see __getattr__),
+    which configures their argtypes on first use.
+    """
+    global _clusol
+    if _clusol is None:
+        # RTLD_NOW resolves every relocation at load time, so the first
+        # call to each entry point skips the lazy PLT fixup; RTLD_LOCAL
+        # keeps the library's symbols out of the global namespace. On
+        # glibc, RTLD_DEEPBIND additionally makes libclusol's BLAS
+        # references bind to the BLAS it was linked against rather than
+        # whatever the host process loaded first. The os.RTLD_*
+        # constants only exist on Unix, so each is looked up guarded;
+        # on Windows the mode collapses to the default 0.
+        mode = getattr(os, 'RTLD_NOW', 0) | getattr(os, 'RTLD_LOCAL', 0)
+        mode |= getattr(os, 'RTLD_DEEPBIND', 0)
+        _clusol = ctypes.CDLL(_find_library(), mode=mode)
+    return _clusol
 
-# clu8adc: Add column
-_clusol.clu8adc.argtypes = [
-    c_int64_p,  # mode
-    c_int64_p,  # m
-    c_int64_p,  # n
-    c_double_p, # v
-    c_double_p, # w
-    c_int64_p,  # lena
-    c_int64_p,  # luparm
-    c_double_p, # parmlu
-    c_double_p, # a
-    c_int64_p,  # indc
-    c_int64_p,  # indr
-    c_int64_p,  # p
-    c_int64_p,  # q
-    c_int64_p,  # lenc
-    c_int64_p,  # lenr
-    c_int64_p,  # locc
-    c_int64_p,  # locr
-    c_int64_p,  # inform
-    c_double_p, # diag
-    c_double_p, # vnorm
-]
-_clusol.clu8adc.restype = None
 
-
-# clu8adr: Add row
-_clusol.clu8adr.argtypes = [
-    c_int64_p,  # m
-    c_int64_p,  # n
-    c_double_p, # w
-    c_int64_p,  # lena
-    c_int64_p,  # luparm
-    c_double_p, # parmlu
-    c_double_p, # a
-    c_int64_p,  # indc
-    c_int64_p,  # indr
-    c_int64_p,  # p
-    c_int64_p,  # q
-    c_int64_p,  # lenc
-    c_int64_p,  # lenr
-    c_int64_p,  # locc
-    c_int64_p,  # locr
-    c_int64_p,  # inform
-    c_double_p, # diag
-]
-_clusol.clu8adr.restype = None
-
-
-# clu8dlc: Delete column
-_clusol.clu8dlc.argtypes = [
-    c_int64_p,  # m
-    c_int64_p,  # n
-    c_int64_p,  # jdel
-    c_int64_p,  # lena
-    c_int64_p,  # luparm
-    c_double_p, # parmlu
-    c_double_p, # a
-    c_int64_p,  # indc
-    c_int64_p,  # indr
-    c_int64_p,  # p
-    c_int64_p,  # q
-    c_int64_p,  # lenc
-    c_int64_p,  # lenr
-    c_int64_p,  # locc
-    c_int64_p,  # locr
-    c_int64_p,  # inform
-]
-_clusol.clu8dlc.restype = None
-
-
-# clu8dlr: Delete row
-_clusol.clu8dlr.argtypes = [
-    c_int64_p,  # mode
-    c_int64_p,  # m
-    c_int64_p,  # n
-    c_int64_p,  # idel
-    c_double_p, # v
-    c_double_p, # w
-    c_int64_p,  # lena
-    c_int64_p,  # luparm
-    c_double_p, # parmlu
-    c_double_p, # a
-    c_int64_p,  # indc
-    c_int64_p,  # indr
-    c_int64_p,  # p
-    c_int64_p,  # q
-    c_int64_p,  # lenc
-    c_int64_p,  # lenr
-    c_int64_p,  # locc
-    c_int64_p,  # locr
-    c_int64_p,  # inform
-]
-_clusol.clu8dlr.restype = None
-
-
-# clu8mod: Rank-1 modification
-_clusol.clu8mod.argtypes = [
-    c_int64_p,  # mode
-    c_int64_p,  # m
-    c_int64_p,  # n
-    c_double_p, # beta
-    c_double_p, # v
-    c_double_p, # w
-    c_int64_p,  # lena
-    c_int64_p,  # luparm
-    c_double_p, # parmlu
-    c_double_p, # a
-    c_int64_p,  # indc
-    c_int64_p,  # indr
-    c_int64_p,  # p
-    c_int64_p,  # q
-    c_int64_p,  # lenc
-    c_int64_p,  # lenr
-    c_int64_p,  # locc
-    c_int64_p,  # locr
-    c_int64_p,  # inform
-]
-_clusol.clu8mod.restype = None
+# Define ctypes for int64_t* and double*
+c_int64_p = ctypes.POINTER(ctypes.c_int64)
+c_double_p = ctypes.POINTER(ctypes.c_double)
 
 
-# clu8rpr: Replace row
-_clusol.clu8rpr.argtypes = [
-    c_int64_p,  # mode1
-    c_int64_p,  # mode2
-    c_int64_p,  # m
-    c_int64_p,  # n
-    c_int64_p,  # irep
-    c_double_p, # v
-    c_double_p, # w
-    c_double_p, # wnew
-    c_int64_p,  # lena
-    c_int64_p,  # luparm
-    c_double_p, # parmlu
-    c_double_p, # a
-    c_int64_p,  # indc
-    c_int64_p,  # indr
-    c_int64_p,  # p
-    c_int64_p,  # q
-    c_int64_p,  # lenc
-    c_int64_p,  # lenr
-    c_int64_p,  # locc
-    c_int64_p,  # locr
-    c_int64_p,  # inform
-]
-_clusol.clu8rpr.restype = None
+# NumPy arrays are passed straight through to the C interface; ndpointer
+# validates dtype and contiguity once per call and extracts the data
+# pointer in C, so call sites no longer need .ctypes.data_as(...).
+_i64_arr = ndpointer(dtype=np.int64, flags='C_CONTIGUOUS')
+_f64_arr = ndpointer(dtype=np.float64, flags='C_CONTIGUOUS')
+
+
+# Argument signatures for every LUSOL entry point, one character per
+# argument: 'P' for an int64_t array, 'd' for a double array, 'i' for a
+# scalar int64_t passed by reference, and 'x' for a scalar double passed
+# by reference.  These mirror the declarations in src/clusol.h, where
+# the argument names are documented.
+_ARGTYPE_CODES = {
+    'P': _i64_arr,
+    'd': _f64_arr,
+    'i': c_int64_p,
+    'x': c_double_p,
+}
+
+# The signature table is normally generated from src/clusol.h at build
+# time (see setup.py), so the bindings cannot drift from the C
+# interface. The inline table below is the fallback for checkouts where
+# setup.py has not run.
+try:
+    from ._argtypes import SIGS as _SIGS
+except ImportError:
+    _SIGS = {
+        "clu1fac": "iiiiPddPPPPPPPPPPPPdi",
+        "clu6sol": "iiiddiPddPPPPPPPPi",
+        "clu6sol_batch": "iiiiddiPddPPPPPPPPi",
+        "clu8rpc": "iiiiiddiPddPPPPPPPPixx",
+        "clu6mul": "iiiddiPddPPPPPPPP",
+        "clu8adc": "iiiddiPddPPPPPPPPixx",
+        "clu8adr": "iidiPddPPPPPPPPix",
+        "clu8dlc": "iiiiPddPPPPPPPPi",
+        "clu8dlr": "iiiiddiPddPPPPPPPPi",
+        "clu8mod": "iiixddiPddPPPPPPPPi",
+        "clu8rpr": "iiiiidddiPddPPPPPPPPi",
+    }
+
+
+def __getattr__(name):
+    """Configure and expose LUSOL entry points on first access (PEP 562)
+
+    Most callers only ever touch clu1fac and clu6sol; building the
+    argtypes lists for the whole lu8 update family up front is wasted
+    work, so each entry point is configured the first time it is looked
+    up and then cached in the module globals. Symbols absent from the
+    loaded library (e.g. prebuilt libraries that predate the batch
+    entry point) surface as the usual AttributeError.
+    """
+    if name in _SIGS:
+        fn = getattr(_get_clusol(), name)
+        fn.argtypes = [_ARGTYPE_CODES[c] for c in _SIGS[name]]
+        fn.restype = None
+        globals()[name] = fn
+        return fn
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Export the library and functions
-__all__ = ['_clusol']
+__all__ = ['_get_clusol']
@@ -6,8 +6,175 @@ This module provides a user-friendly object-oriented interface to LUSOL.
 
 import numpy as np
 import ctypes
-from scipy.sparse import coo_matrix, csr_matrix, issparse
-from .clusol import _clusol
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from scipy.linalg import solve_banded
+from scipy.sparse import issparse
+from . import clusol
+from .clusol import _get_clusol
+
+# Optional fast bindings for the hot entry points, tried best first:
+# the compiled Cython module (built by setup.py when Cython and a C
+# toolchain are available), then the CFFI ABI-mode module (needs only
+# the cffi package), both exposing the same call surface. The ctypes
+# path below is the always-available fallback.
+try:
+    from . import _clusol_cy
+except ImportError:
+    try:
+        from . import _clusol_cffi as _clusol_cy
+    except ImportError:
+        _clusol_cy = None
+
+
+# Default LUSOL parameter templates. Instances copy these with a single
+# C-level memcpy instead of filling the arrays element by element, which
+# matters when many small factorizations are created in a loop.
+#
+# luparm parameters (0-indexed in Python, 1-indexed in Fortran docs)
+_LUPARM_DEFAULT = np.zeros(30, dtype=np.int64)
+_LUPARM_DEFAULT[0] = 0   # nout: output unit (0 = no output)
+_LUPARM_DEFAULT[1] = 10  # lprint: print level
+_LUPARM_DEFAULT[2] = 5   # maxcol: max columns in Markowitz search
+_LUPARM_DEFAULT[5] = 0   # pivot: pivoting method (0=TPP, 1=TRP, 2=TCP, 3=TSP)
+_LUPARM_DEFAULT[7] = 1   # keepLU: keep = 1 to save LU factors
+
+# parmlu parameters
+_PARMLU_DEFAULT = np.zeros(30, dtype=np.float64)
+_PARMLU_DEFAULT[0] = 10.0   # Lmax1: max multiplier in initial Lmax
+_PARMLU_DEFAULT[1] = 10.0   # Lmax2: max multiplier in later Lmax
+_PARMLU_DEFAULT[2] = 1e-13  # small: absolute pivot tolerance (eps^0.8)
+_PARMLU_DEFAULT[3] = 1e-11  # Utol1: abs tol for flagging small diagonals (eps^0.67)
+_PARMLU_DEFAULT[4] = 1e-11  # Utol2: rel tol for flagging small diagonals (eps^0.67)
+_PARMLU_DEFAULT[5] = 3.0    # Uspace: Space factor for U
+_PARMLU_DEFAULT[6] = 0.3    # dens1: density for threshold pivoting
+_PARMLU_DEFAULT[7] = 0.5    # dens2: density for dense LU
+
+
+# Cap on how many times _factorize doubles lena before giving up, so a
+# pathological matrix cannot grow storage without bound
+_MAX_STORAGE_RETRIES = 8
+
+# Human-readable descriptions of LUSOL's nonzero inform codes (see the
+# lu1fac header in src/lusol.f90), looked up only on the error path so
+# successful calls never format a message
+_INFORM_MSGS = {
+    1: "singularity detected",
+    3: "row/column index out of range",
+    4: "duplicate matrix entry",
+    7: "insufficient storage (lena too small)",
+    8: "fatal error",
+    9: "no suitable diagonal pivot (matrix not sufficiently definite)",
+    10: "fatal error",
+}
+
+
+def _inform_error(what, code):
+    """Build the RuntimeError for a nonzero inform code"""
+    return RuntimeError(
+        f"{what} failed with inform = {code}: "
+        f"{_INFORM_MSGS.get(code, 'unknown error')}")
+
+# Widest band (number of sub- or superdiagonals) still routed to the
+# dedicated banded solver instead of the general sparse LU
+_BANDED_MAX_BW = 2
+
+# Workspace buffers at least this large are prefaulted right after
+# allocation (see _prefault)
+_PREFAULT_THRESHOLD = 1 << 24  # 16 MiB
+
+_MADV_WILLNEED = 3
+
+_libc = None
+
+
+def _prefault(arr):
+    """Ask the kernel to fault in a large buffer's pages up front
+
+    Freshly allocated pages are otherwise faulted in one at a time while
+    clu1fac writes into them, serializing page faults against the
+    factorization. madvise(MADV_WILLNEED) batches that work at
+    allocation time. Linux only and strictly best-effort: any failure
+    just leaves the default demand-paging behavior.
+    """
+    global _libc
+    if arr.nbytes < _PREFAULT_THRESHOLD or not sys.platform.startswith('linux'):
+        return
+    try:
+        if _libc is None:
+            _libc = ctypes.CDLL('libc.so.6', use_errno=True)
+        # madvise wants a page-aligned address; round down and cover the
+        # tail of the buffer
+        page = os.sysconf('SC_PAGE_SIZE')
+        start = arr.ctypes.data & ~(page - 1)
+        length = arr.ctypes.data + arr.nbytes - start
+        _libc.madvise(ctypes.c_void_p(start), ctypes.c_size_t(length),
+                      ctypes.c_int(_MADV_WILLNEED))
+    except OSError:
+        pass
+
+
+def _sort_by_col(data, row, col):
+    """Reorder triplets into contiguous column blocks (stable in row)"""
+    order = np.argsort(col, kind='stable')
+    return data[order], row[order], col[order]
+
+
+def _matrix_triplets(A):
+    """Extract (data, row, col) triplets in LUSOL-ready dtypes
+
+    Dense arrays yield their triplets in one np.nonzero pass, and
+    CSR/CSC input is expanded straight from its indptr, skipping the
+    intermediate COO matrix that tocoo() would materialize; other
+    sparse formats go through COO.
+
+    The triplets come back grouped by column: clu1fac builds its column
+    counts and runs its Markowitz search over these arrays, and
+    column-contiguous input keeps those sweeps monotone in memory
+    instead of chasing an arbitrary entry order. CSC already has that
+    layout; the other paths pay one stable argsort up front.
+
+    The retained indices use int32 whenever the dimensions fit, halving
+    the memory held per instance; _load_matrix widens them into the
+    int64 workspaces the library's ABI requires.
+    """
+    idx = np.int32 if max(A.shape) < np.iinfo(np.int32).max else np.int64
+    if isinstance(A, np.ndarray):
+        rows, cols = np.nonzero(A)
+        return _sort_by_col(
+            np.ascontiguousarray(A[rows, cols], dtype=np.float64),
+            rows.astype(idx, copy=False),
+            cols.astype(idx, copy=False))
+
+    if A.format in ('csr', 'csc'):
+        minor = np.asarray(A.indices, dtype=idx)
+        major = np.repeat(np.arange(A.indptr.size - 1, dtype=idx),
+                          np.diff(A.indptr))
+        data = np.asarray(A.data, dtype=np.float64)
+        if A.format == 'csr':
+            return _sort_by_col(data, major, minor)
+        return data, minor, major
+
+    A_coo = A.tocoo()
+    return _sort_by_col(np.asarray(A_coo.data, dtype=np.float64),
+                        np.asarray(A_coo.row, dtype=idx),
+                        np.asarray(A_coo.col, dtype=idx))
+
+
+def _aligned_zeros(n, dtype, align=64):
+    """Allocate a zeroed array whose data starts on an align-byte boundary
+
+    NumPy only guarantees 16-byte alignment, so vector loads in the C
+    library's inner loops can straddle cache lines. Over-allocate and
+    return a view starting at the first aligned element; the view keeps
+    the raw buffer alive through its .base.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    raw = np.zeros(n + align // itemsize, dtype=dtype)
+    offset = (-raw.ctypes.data) % align // itemsize
+    return raw[offset:offset + n]
 
 
 class LUSOL:
@@ -21,7 +188,11 @@ class LUSOL:
     ----------
     A : array_like or sparse matrix
         The matrix to factorize. Can be dense numpy array or scipy sparse matrix.
-    
+    lena_factor : int, optional
+        Multiple of nnz(A) to allocate for fill-in. By default it is
+        chosen from the matrix density, and storage is grown and the
+        factorization retried automatically if it proves too small.
+
     Attributes
     ----------
     m : int
@@ -41,118 +212,276 @@ class LUSOL:
     >>> x = lu.solve(b)
     """
     
-    def __init__(self, A):
+    def __init__(self, A, lena_factor=None):
         """Initialize LUSOL with matrix A"""
-        # Convert to sparse format if needed
+        # Load the LUSOL C library (lazy, shared across instances)
+        self._clusol = _get_clusol()
+
+        # Dense input stays an ndarray: _matrix_triplets reads its
+        # nonzeros directly, with no sparse constructor in between
         if not issparse(A):
-            A = csr_matrix(A)
-        
-        # Convert to COO format for easier access
-        A_coo = A.tocoo()
-        
-        # Store dimensions
-        self.m = A_coo.shape[0]
-        self.n = A_coo.shape[1]
-        self.nelem = A_coo.nnz
-        
-        # Allocate arrays with enough space (factor of 3 for fill-in)
-        self.lena = max(self.nelem * 3, 10000)
-        
-        # Initialize LUSOL parameters
-        self.luparm = np.zeros(30, dtype=np.int64)
-        self.parmlu = np.zeros(30, dtype=np.float64)
-        
-        # Set default parameters
-        self._set_default_parameters()
-        
-        # Allocate data arrays
-        self.a = np.zeros(self.lena, dtype=np.float64)
-        self.indc = np.zeros(self.lena, dtype=np.int64)
-        self.indr = np.zeros(self.lena, dtype=np.int64)
-        
-        # Permutation arrays
-        self.p = np.zeros(self.m, dtype=np.int64)
-        self.q = np.zeros(self.n, dtype=np.int64)
-        
-        # Length and location arrays
-        self.lenc = np.zeros(self.n, dtype=np.int64)
-        self.lenr = np.zeros(self.m, dtype=np.int64)
-        self.locc = np.zeros(self.n, dtype=np.int64)
-        self.locr = np.zeros(self.m, dtype=np.int64)
+            A = np.atleast_2d(np.asarray(A))
+
+        # Keep the matrix triplets: clu1fac consumes the copies in
+        # a/indc/indr, and they are needed again if the factorization
+        # has to be retried with more storage
+        self._A_data, self._A_row, self._A_col = _matrix_triplets(A)
+
+        # Store dimensions. nelem comes from the extracted triplets:
+        # formats like DIA report padding in .nnz
+        self.m = A.shape[0]
+        self.n = A.shape[1]
+        self.nelem = self._A_data.size
         
-        # Location arrays for permutations
-        self.iploc = np.zeros(self.m, dtype=np.int64)
-        self.iqloc = np.zeros(self.n, dtype=np.int64)
-        self.ipinv = np.zeros(self.m, dtype=np.int64)
-        self.iqinv = np.zeros(self.n, dtype=np.int64)
+        # Allocate arrays with enough space for fill-in. Matrices with
+        # few nonzeros per row/column (banded and similar structured
+        # problems) fill modestly and get a tight allocation, since
+        # oversizing streams mostly-empty arrays through the cache
+        # during the factor sweep; denser ones get more headroom up
+        # front. _factorize grows lena on demand if the guess is short.
+        if lena_factor is None:
+            lena_factor = 2 if self.nelem < 10 * max(self.m, self.n) else 5
+        # Never below nelem itself: a small explicit lena_factor must
+        # start the inform-7 growth path, not break _load_matrix
+        self.lena = int(max(lena_factor * self.nelem + 4 * max(self.m, self.n),
+                            self.nelem, 10000))
         
-        # Work array
-        self.w = np.zeros(self.n, dtype=np.float64)
+        # Initialize LUSOL parameters from the module-level templates
+        self.luparm = _LUPARM_DEFAULT.copy()
+        self.parmlu = _PARMLU_DEFAULT.copy()
         
-        # Copy matrix data into LUSOL arrays (1-indexed for Fortran)
-        # NOTE: LUSOL expects row indices in indc and column indices in indr!
-        for i in range(self.nelem):
-            self.a[i] = A_coo.data[i]
-            self.indc[i] = A_coo.row[i] + 1  # Row index in indc (1-indexed)
-            self.indr[i] = A_coo.col[i] + 1  # Column index in indr (1-indexed)
+        # All workspaces are carved out of two contiguous buffers (one
+        # int64, one float64) so the arrays the C factorization touches
+        # together share one address range instead of landing on
+        # unrelated heap pages
+        self._allocate_workspaces()
+
+        # Persistent ctypes scalar cells for by-reference arguments,
+        # reused across calls to avoid per-call ctypes allocations
+        self._c_m = ctypes.c_int64(self.m)
+        self._c_n = ctypes.c_int64(self.n)
+        self._c_nelem = ctypes.c_int64(self.nelem)
+        self._c_lena = ctypes.c_int64(self.lena)
+        self._c_mode = ctypes.c_int64(0)
+        self._c_inform = ctypes.c_int64(0)
+        self._cache_call_args()
         
+        # Narrow banded matrices additionally get a direct O(n) solve
+        # path (see _detect_banded)
+        self._detect_banded()
+
         # Perform factorization
+        self._load_matrix()
         self._factorize()
     
-    def _set_default_parameters(self):
-        """Set default LUSOL parameters"""
-        # luparm parameters (0-indexed in Python, 1-indexed in Fortran docs)
-        self.luparm[0] = 0   # nout: output unit (0 = no output)
-        self.luparm[1] = 10  # lprint: print level
-        self.luparm[2] = 5   # maxcol: max columns in Markowitz search
-        self.luparm[5] = 0   # pivot: pivoting method (0=TPP, 1=TRP, 2=TCP, 3=TSP)
-        self.luparm[7] = 1   # keepLU: keep = 1 to save LU factors
-        
-        # parmlu parameters
-        self.parmlu[0] = 10.0  # Lmax1: max multiplier in initial Lmax
-        self.parmlu[1] = 10.0  # Lmax2: max multiplier in later Lmax
-        self.parmlu[2] = 1e-13  # small: absolute pivot tolerance (eps^0.8)
-        self.parmlu[3] = 1e-11  # Utol1: abs tol for flagging small diagonals (eps^0.67)
-        self.parmlu[4] = 1e-11  # Utol2: rel tol for flagging small diagonals (eps^0.67)
-        self.parmlu[5] = 3.0   # Uspace: Space factor for U
-        self.parmlu[6] = 0.3   # dens1: density for threshold pivoting
-        self.parmlu[7] = 0.5   # dens2: density for dense LU
-    
+    def _allocate_workspaces(self):
+        """Allocate the LUSOL data and index arrays as slab slices
+
+        One spare element is left between consecutive views: LUSOL's
+        permutation bookkeeping (lu1pq2) can touch index 0 of an array,
+        one element below its start. With independent allocations that
+        lands in heap slack; in a slab it would corrupt the previous
+        array, so each view gets a guard slot in front of it.
+        """
+        m, n, lena = self.m, self.n, self.lena
+
+        # Integer workspaces: two lena-sized index arrays plus eight
+        # permutation/length/location arrays (sized per gen/lu1fac.org:
+        # iploc has length n and iqloc length m)
+        sizes = [lena, lena, m, n, n, m, n, m, n, m, m, n]
+        self._ibuf = np.zeros(sum(sizes) + len(sizes), dtype=np.int64)
+        views = []
+        o = 0
+        for size in sizes:
+            o += 1  # guard slot
+            views.append(self._ibuf[o:o + size])
+            o += size
+        (self.indc, self.indr, self.p, self.q,
+         self.lenc, self.lenr, self.locc, self.locr,
+         self.iploc, self.iqloc, self.ipinv, self.iqinv) = views
+
+        # Double workspaces: matrix/factor data plus the work array.
+        # The slab itself is 64-byte aligned and the guard gaps are a
+        # whole cache line (8 doubles, rounding lena up), so both a and
+        # w start on cache-line boundaries for the factor sweeps.
+        gap = 8
+        pad = (-lena) % gap
+        self._dbuf = _aligned_zeros(2 * gap + lena + pad + n, np.float64)
+        self.a = self._dbuf[gap:gap + lena]
+        self.w = self._dbuf[2 * gap + lena + pad:]
+
+        # Persistent solve workspaces: clu6sol overwrites both v and w,
+        # so solve() stages the right-hand side here with a raw memmove
+        # and hands back a copy of the result, instead of allocating
+        # fresh vectors on every call. Both live in one scratch slab
+        # (cache-line aligned like a/w above) so a solve touches one
+        # address range, and the update wrappers reuse them as their
+        # work arrays rather than calling np.zeros per update.
+        spad = (-m) % gap
+        self._sbuf = _aligned_zeros(m + spad + n, np.float64)
+        self._v = self._sbuf[:m]
+        self._w = self._sbuf[m + spad:]
+
+        # For big factorizations, fault the slab pages in now rather
+        # than one page at a time under clu1fac
+        _prefault(self._ibuf)
+        _prefault(self._dbuf)
+
+    def _cache_call_args(self):
+        """Rebuild the cached per-call ctypes argument objects
+
+        ctypes.byref allocates a fresh argument object on every call,
+        and most entry points share the same ten factor-array trailing
+        arguments. Both are invariant between calls, so they are built
+        once here and again whenever the workspaces are reallocated.
+        """
+        self._b_m = ctypes.byref(self._c_m)
+        self._b_n = ctypes.byref(self._c_n)
+        self._b_nelem = ctypes.byref(self._c_nelem)
+        self._b_lena = ctypes.byref(self._c_lena)
+        self._b_mode = ctypes.byref(self._c_mode)
+        self._b_inform = ctypes.byref(self._c_inform)
+
+        # Shared lena..locr argument tail of clu6sol/clu6mul/clu8* calls
+        self._arg_tail = (self._b_lena, self.luparm, self.parmlu, self.a,
+                          self.indc, self.indr, self.p, self.q,
+                          self.lenc, self.lenr, self.locc, self.locr)
+
+        # Scratch boxes for the batch and update entry points
+        self._c_nrhs = ctypes.c_int64(0)
+        self._b_nrhs = ctypes.byref(self._c_nrhs)
+        self._c_mode1 = ctypes.c_int64(0)
+        self._b_mode1 = ctypes.byref(self._c_mode1)
+        self._c_mode2 = ctypes.c_int64(0)
+        self._b_mode2 = ctypes.byref(self._c_mode2)
+        self._c_j = ctypes.c_int64(0)
+        self._b_j = ctypes.byref(self._c_j)
+        self._c_diag = ctypes.c_double(0.0)
+        self._b_diag = ctypes.byref(self._c_diag)
+        self._c_vnorm = ctypes.c_double(0.0)
+        self._b_vnorm = ctypes.byref(self._c_vnorm)
+        self._c_beta = ctypes.c_double(0.0)
+        self._b_beta = ctypes.byref(self._c_beta)
+
+    def _detect_banded(self):
+        """Check for a narrow banded pattern and build its band storage
+
+        For square matrices whose nonzeros all sit within a couple of
+        diagonals (tridiagonal diffusion grids and the like), a
+        dedicated banded solve is O(n) with small constants and beats
+        the general sparse back-substitution. solve() routes modes 5
+        and 6 through scipy.linalg.solve_banded when this detection
+        fires; column updates invalidate it.
+        """
+        self._band = None
+        self._band_t = None
+        if self.m != self.n or self.nelem == 0:
+            return
+        off = self._A_row - self._A_col
+        kl = int(max(off.max(), 0))   # subdiagonals
+        ku = int(max(-off.min(), 0))  # superdiagonals
+        if kl > _BANDED_MAX_BW or ku > _BANDED_MAX_BW:
+            return
+        # solve_banded's diagonal-ordered form: ab[ku + i - j, j] = A[i, j]
+        ab = np.zeros((kl + ku + 1, self.n), dtype=np.float64)
+        ab[ku + off, self._A_col] = self._A_data
+        self._band = ((kl, ku), ab)
+
+    def _band_transpose(self):
+        """Band storage of A', built on first mode-6 banded solve"""
+        if self._band_t is None:
+            (kl, ku), _ = self._band
+            ab = np.zeros((kl + ku + 1, self.n), dtype=np.float64)
+            ab[kl + self._A_col - self._A_row, self._A_row] = self._A_data
+            self._band_t = ((ku, kl), ab)
+        return self._band_t
+
+    def _load_matrix(self):
+        """Copy the matrix triplets into the LUSOL arrays (1-indexed for Fortran)
+
+        NOTE: LUSOL expects row indices in indc and column indices in indr!
+        """
+        ne = self.nelem
+        self.a[:ne] = self._A_data
+        # np.add with out= shifts to 1-based indexing without the
+        # nnz-sized temporary that `row + 1` would allocate
+        np.add(self._A_row, 1, out=self.indc[:ne])
+        np.add(self._A_col, 1, out=self.indr[:ne])
+
     def _factorize(self):
-        """Perform LU factorization"""
-        inform = ctypes.c_int64(0)
-        
-        _clusol.clu1fac(
-            ctypes.byref(ctypes.c_int64(self.m)),
-            ctypes.byref(ctypes.c_int64(self.n)),
-            ctypes.byref(ctypes.c_int64(self.nelem)),
-            ctypes.byref(ctypes.c_int64(self.lena)),
-            self.luparm.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.parmlu.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            self.a.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            self.indc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.indr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.p.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.q.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.lenc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.lenr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.locc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.locr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.iploc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.iqloc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.ipinv.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.iqinv.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.w.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            ctypes.byref(inform)
+        """Perform LU factorization, growing storage on demand
+
+        When clu1fac reports insufficient storage (inform = 7), lena is
+        doubled, the workspaces reallocated and the factorization
+        retried, up to _MAX_STORAGE_RETRIES growths; clu1fac destroys
+        its input triplets, so the matrix is reloaded from the stored
+        copies each attempt.
+        """
+        retries = 0
+        while True:
+            self._call_clu1fac()
+            if self._c_inform.value != 7 or retries == _MAX_STORAGE_RETRIES:
+                break
+            retries += 1
+            self.lena *= 2
+            self._c_lena.value = self.lena
+            self._allocate_workspaces()
+            self._cache_call_args()
+            self._load_matrix()
+
+        if self._c_inform.value != 0:
+            raise _inform_error("LU factorization", self._c_inform.value)
+
+    def _call_clu1fac(self):
+        """Run one clu1fac attempt on the current workspaces"""
+        self._c_inform.value = 0
+
+        if _clusol_cy is not None:
+            self._c_inform.value = _clusol_cy.clu1fac(
+                self.m, self.n, self.nelem, self.lena,
+                self.luparm, self.parmlu, self.a,
+                self.indc, self.indr, self.p, self.q,
+                self.lenc, self.lenr, self.locc, self.locr,
+                self.iploc, self.iqloc, self.ipinv, self.iqinv,
+                self.w)
+            return
+
+        clusol.clu1fac(
+            self._b_m,
+            self._b_n,
+            self._b_nelem,
+            self._b_lena,
+            self.luparm,
+            self.parmlu,
+            self.a,
+            self.indc,
+            self.indr,
+            self.p,
+            self.q,
+            self.lenc,
+            self.lenr,
+            self.locc,
+            self.locr,
+            self.iploc,
+            self.iqloc,
+            self.ipinv,
+            self.iqinv,
+            self.w,
+            self._b_inform
         )
-        
-        if inform.value != 0:
-            raise RuntimeError(f"LU factorization failed with inform = {inform.value}")
-    
-    def solve(self, b, mode=5):
+
+
+    def _check_out(self, out, size):
+        """Validate an out= buffer LUSOL can write into directly"""
+        if (not isinstance(out, np.ndarray) or out.dtype != np.float64
+                or not out.flags.c_contiguous or out.shape != (size,)):
+            raise ValueError(
+                f"out must be a C-contiguous float64 array of length {size}")
+
+    def solve(self, b, mode=5, inplace=False, out=None):
         """
         Solve a linear system using the LU factors
-        
+
         Parameters
         ----------
         b : array_like
@@ -165,69 +494,332 @@ class LUSOL:
             - 4: solve U'*v = w
             - 5: solve A*x = b (default)
             - 6: solve A'*x = b
-        
+        inplace : bool, optional
+            Let LUSOL use b itself as its input workspace instead of
+            staging a copy; b is overwritten. Only takes effect when b
+            is already a contiguous float64 vector.
+        out : ndarray, optional
+            Buffer to receive the solution (contiguous float64 of the
+            right length); skips the result copy. Only honored for 1-D
+            right-hand sides; a matrix b is solved column by column and
+            returns a fresh array.
+
         Returns
         -------
         x : ndarray
-            Solution vector
+            Solution vector (out when it was given)
         """
-        b = np.asarray(b, dtype=np.float64)
-        
-        # Check input size and initialize v, w based on mode
-        v = np.zeros(self.m, dtype=np.float64)
-        w = np.zeros(self.n, dtype=np.float64)
-        
-        if mode in [1, 2, 3, 5]:
-            # Input goes into v, must be size m
+        b = np.ascontiguousarray(b, dtype=np.float64)
+        # Only vectors reach the memmove staging below (matrices go to
+        # _solve_batch); higher-rank input would overrun the workspace
+        if b.ndim > 2:
+            raise ValueError(f"b must be 1- or 2-dimensional, got shape {b.shape}")
+
+        # Validate mode and right-hand-side size before dispatching, so
+        # the banded shortcut and the general path report bad input the
+        # same way
+        if mode in (1, 2, 3, 5):
             if b.shape[0] != self.m:
                 raise ValueError(f"Right-hand side vector size {b.shape[0]} does not match matrix rows {self.m}")
-            v = b.copy()
-        elif mode in [4, 6]:
-            # Input goes into w, must be size n
+        elif mode in (4, 6):
             if b.shape[0] != self.n:
                 raise ValueError(f"Right-hand side vector size {b.shape[0]} does not match matrix columns {self.n}")
-            w = b.copy()
         else:
             raise ValueError(f"Invalid mode {mode}. Must be 1-6.")
-        
-        inform = ctypes.c_int64(0)
-        
-        _clusol.clu6sol(
-            ctypes.byref(ctypes.c_int64(mode)),
-            ctypes.byref(ctypes.c_int64(self.m)),
-            ctypes.byref(ctypes.c_int64(self.n)),
-            v.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            w.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            ctypes.byref(ctypes.c_int64(self.lena)),
-            self.luparm.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.parmlu.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            self.a.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            self.indc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.indr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.p.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.q.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.lenc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.lenr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.locc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.locr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            ctypes.byref(inform)
-        )
-        
-        if inform.value != 0:
-            raise RuntimeError(f"Solve failed with inform = {inform.value}")
-        
-        # Return appropriate output based on mode
-        if mode in [3, 5]:
-            # Output is in w
-            return w
+
+        # Detected narrow banded matrices skip the general solve; on a
+        # numerical failure (e.g. a singular band) fall through to LUSOL
+        if self._band is not None and mode in (5, 6):
+            bands, ab = self._band if mode == 5 else self._band_transpose()
+            try:
+                x = solve_banded(bands, ab, b)
+            except np.linalg.LinAlgError:
+                pass
+            else:
+                if out is not None and x.ndim == 1:
+                    self._check_out(out, x.shape[0])
+                    np.copyto(out, x)
+                    return out
+                return x
+
+        # A matrix of right-hand sides is solved column by column in C
+        if b.ndim == 2:
+            return self._solve_batch(b, mode)
+
+        # Stage the right-hand side in the persistent workspaces: a raw
+        # memmove into warm buffers skips both the per-call allocation
+        # and the NumPy slice-assignment dispatch. With inplace the
+        # caller's b is the workspace; with out= the solution lands in
+        # the caller's buffer with no copy at all.
+        if mode in (1, 2, 3, 5):
+            # Input goes into v (size m, validated above)
+            if inplace:
+                v = b
+            else:
+                v = self._v
+                ctypes.memmove(v.ctypes.data, b.ctypes.data, b.nbytes)
+            if mode in (3, 5) and out is not None:
+                self._check_out(out, self.n)
+                w = out
+            else:
+                w = self._w
+            if mode in (3, 5):
+                # w is the output and may be only partially set when U
+                # is singular; the pure L solves (modes 1, 2) never
+                # touch w, so skip the n-length memset for them
+                w.fill(0.0)
         else:
-            # Output is in v (modes 1, 2, 4, 6)
-            return v
-    
-    def mulA(self, x, mode=1):
+            # Modes 4, 6: input goes into w (size n, validated above)
+            if inplace:
+                w = b
+            else:
+                w = self._w
+                ctypes.memmove(w.ctypes.data, b.ctypes.data, b.nbytes)
+            if out is not None:
+                self._check_out(out, self.m)
+                v = out
+            else:
+                v = self._v
+            v.fill(0.0)
+
+        self._c_mode.value = mode
+        self._clu6sol(self._c_mode, v, w, self._c_inform)
+
+        result = w if mode in (3, 5) else v
+
+        # The result is copied out of the persistent workspace so the
+        # returned vector survives the next solve -- unless it already
+        # sits in a caller-owned buffer (out, or b for inplace modes
+        # whose output lands in the input vector)
+        if out is not None:
+            if result is not out:
+                self._check_out(out, result.shape[0])
+                np.copyto(out, result)
+            return out
+        if inplace and result is b:
+            return result
+        return result.copy()
+
+    def solve_A(self, b):
+        """
+        Solve A*x = b with minimal per-call overhead
+
+        Specialized mode-5 path for tight loops (simplex pivoting and
+        the like) that trusts the caller: b must already be a
+        C-contiguous float64 vector of length m. Skips the input
+        coercion, mode dispatch and banded shortcut that the general
+        solve() performs.
+
+        Parameters
+        ----------
+        b : ndarray
+            Right-hand side, contiguous float64 of length m
+
+        Returns
+        -------
+        x : ndarray
+            Solution vector of length n
+        """
+        v = self._v
+        ctypes.memmove(v.ctypes.data, b.ctypes.data, v.nbytes)
+        w = self._w
+        w.fill(0.0)
+        self._c_mode.value = 5
+        self._clu6sol(self._c_mode, v, w, self._c_inform)
+        return w.copy()
+
+    def solve_many(self, B, mode=5, max_workers=None):
+        """
+        Solve a linear system for many right-hand sides in parallel
+
+        The solve phase does not modify the LU factors, so the columns
+        run concurrently on multiple cores: via an OpenMP loop in the
+        Cython module when it is built, otherwise with one clu6sol call
+        per column on worker threads (ctypes releases the GIL around
+        the call). Each column gets its own v/w workspaces. Note that
+        every solve stores diagnostics into the shared luparm[9] and
+        parmlu[19] slots, so after a parallel batch those reflect
+        whichever column finished last; the per-column inform codes
+        used for error reporting are kept separately.
+
+        Parameters
+        ----------
+        B : array_like
+            Right-hand side matrix with one system per column
+        mode : int, optional
+            Solution mode, same meaning as in `solve` (default: 5)
+        max_workers : int, optional
+            Number of worker threads. Leaving it at None picks the
+            OpenMP path when available; setting it forces the thread
+            pool with that many workers.
+
+        Returns
+        -------
+        X : ndarray
+            Solution matrix, one solution per column
+        """
+        B = np.asarray(B, dtype=np.float64)
+        if B.ndim != 2:
+            raise ValueError(f"B must be 2-dimensional, got shape {B.shape}")
+
+        if mode in (1, 2, 3, 5):
+            nin = self.m
+        elif mode in (4, 6):
+            nin = self.n
+        else:
+            raise ValueError(f"Invalid mode {mode}. Must be 1-6.")
+        if B.shape[0] != nin:
+            raise ValueError(f"Right-hand side size {B.shape[0]} does not match expected size {nin}")
+
+        # Only the Cython backend has the OpenMP loop; the CFFI backend
+        # still benefits from the thread pool below
+        if max_workers is None and hasattr(_clusol_cy, 'clu6sol_many_parallel'):
+            return self._solve_many_openmp(B, mode)
+
+        nout = self.n if mode in (3, 5) else self.m
+        nrhs = B.shape[1]
+        X = np.empty((nout, nrhs), dtype=np.float64)
+
+        # Per-thread v/w workspaces: clu6sol overwrites both
+        tls = threading.local()
+
+        def solve_column(j):
+            try:
+                v, w, c_mode, c_inform = tls.workspaces
+            except AttributeError:
+                v = np.zeros(self.m, dtype=np.float64)
+                w = np.zeros(self.n, dtype=np.float64)
+                c_mode = ctypes.c_int64(mode)
+                c_inform = ctypes.c_int64(0)
+                tls.workspaces = (v, w, c_mode, c_inform)
+            if mode in (1, 2, 3, 5):
+                v[:] = B[:, j]
+                if mode in (3, 5):
+                    w.fill(0.0)
+            else:
+                w[:] = B[:, j]
+                v.fill(0.0)
+            self._clu6sol(c_mode, v, w, c_inform)
+            X[:, j] = w if mode in (3, 5) else v
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the iterator so worker exceptions propagate
+            for _ in executor.map(solve_column, range(nrhs)):
+                pass
+
+        return X
+
+    def _solve_many_openmp(self, B, mode):
+        """Solve the columns of B with the Cython prange loop
+
+        Same row-per-RHS staging as _solve_batch; the per-column inform
+        codes come back in an array so a failed column can be reported
+        precisely.
+        """
+        nrhs = B.shape[1]
+        V = np.zeros((nrhs, self.m), dtype=np.float64)
+        W = np.zeros((nrhs, self.n), dtype=np.float64)
+        if mode in (1, 2, 3, 5):
+            np.copyto(V, B.T, casting='no')
+        else:
+            np.copyto(W, B.T, casting='no')
+
+        informs = np.zeros(nrhs, dtype=np.int64)
+        _clusol_cy.clu6sol_many_parallel(
+            mode, self.m, self.n, V, W, self.lena,
+            self.luparm, self.parmlu, self.a,
+            self.indc, self.indr, self.p, self.q,
+            self.lenc, self.lenr, self.locc, self.locr, informs)
+
+        bad = np.nonzero(informs)[0]
+        if bad.size:
+            raise _inform_error(f"Solve for column {bad[0]}",
+                                int(informs[bad[0]]))
+
+        out = W if mode in (3, 5) else V
+        return np.ascontiguousarray(out.T)
+
+    def _solve_batch(self, B, mode):
+        """
+        Solve for all columns of B with one C-level loop
+
+        The loop over right-hand sides runs in C, so the per-call
+        binding overhead is paid once for the whole batch: via the
+        Cython clu6sol_many when built, else the library's
+        clu6sol_batch, else thread-parallel solve_many as a last
+        resort.
+        """
+        if mode in (1, 2, 3, 5):
+            nin = self.m
+        elif mode in (4, 6):
+            nin = self.n
+        else:
+            raise ValueError(f"Invalid mode {mode}. Must be 1-6.")
+        if B.shape[0] != nin:
+            raise ValueError(f"Right-hand side size {B.shape[0]} does not match expected size {nin}")
+
+        if _clusol_cy is None:
+            try:
+                clu6sol_batch = clusol.clu6sol_batch
+            except AttributeError:
+                return self.solve_many(B, mode=mode)
+
+        nrhs = B.shape[1]
+
+        # The batch loops expect the nrhs vectors stored back to back
+        V = np.zeros((nrhs, self.m), dtype=np.float64)
+        W = np.zeros((nrhs, self.n), dtype=np.float64)
+        if mode in (1, 2, 3, 5):
+            np.copyto(V, B.T, casting='no')
+        else:
+            np.copyto(W, B.T, casting='no')
+
+        self._c_mode.value = mode
+        self._c_inform.value = 0
+
+        if _clusol_cy is not None:
+            self._c_inform.value = _clusol_cy.clu6sol_many(
+                mode, self.m, self.n, V, W, self.lena,
+                self.luparm, self.parmlu, self.a,
+                self.indc, self.indr, self.p, self.q,
+                self.lenc, self.lenr, self.locc, self.locr)
+        else:
+            self._c_nrhs.value = nrhs
+            clu6sol_batch(self._b_mode, self._b_m, self._b_n,
+                          self._b_nrhs, V, W,
+                          *self._arg_tail, self._b_inform)
+
+        if self._c_inform.value != 0:
+            raise _inform_error("Solve", self._c_inform.value)
+
+        out = W if mode in (3, 5) else V
+        return np.ascontiguousarray(out.T)
+
+    def _clu6sol(self, c_mode, v, w, c_inform):
+        """Call clu6sol on the v/w workspaces, raising on bad inform
+
+        The scalar cells are passed in so that callers running on worker
+        threads can supply thread-private ones.
+        """
+        c_inform.value = 0
+
+        if _clusol_cy is not None:
+            c_inform.value = _clusol_cy.clu6sol(
+                c_mode.value, self.m, self.n, v, w, self.lena,
+                self.luparm, self.parmlu, self.a,
+                self.indc, self.indr, self.p, self.q,
+                self.lenc, self.lenr, self.locc, self.locr)
+        else:
+            clusol.clu6sol(ctypes.byref(c_mode), self._b_m, self._b_n, v, w,
+                           *self._arg_tail, ctypes.byref(c_inform))
+
+        if c_inform.value != 0:
+            raise _inform_error("Solve", c_inform.value)
+
+    def mulA(self, x, mode=1, inplace=False, out=None):
         """
         Multiply by the original matrix or its transpose
-        
+
         Parameters
         ----------
         x : array_like
@@ -239,62 +831,96 @@ class LUSOL:
             - 4: compute y = U'*x (U transpose, x size m, output size n)
             - 5: compute y = A*x (default, x size n, output size m)
             - 6: compute y = A'*x (A transpose, x size m, output size n)
-        
+        inplace : bool, optional
+            Let LUSOL use x itself as its input workspace instead of
+            staging a copy; x is overwritten. Only takes effect when x
+            is already a contiguous float64 vector.
+        out : ndarray, optional
+            Buffer to receive the product (contiguous float64 of the
+            right length); skips the result copy.
+
         Returns
         -------
         y : ndarray
-            Result vector
+            Result vector (out when it was given)
         """
-        x = np.asarray(x, dtype=np.float64)
-        
-        # Initialize v and w based on mode
-        v = np.zeros(self.m, dtype=np.float64)
-        w = np.zeros(self.n, dtype=np.float64)
-        
-        if mode in [1, 2, 6]:
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        # The memmove staging below copies x.nbytes into a fixed-size
+        # workspace, so anything but a vector must be rejected up front
+        if x.ndim != 1:
+            raise ValueError(f"x must be 1-dimensional, got shape {x.shape}")
+
+        # Stage the input in the same persistent workspaces solve uses;
+        # clu6mul overwrites both, and the result is copied out below
+        if mode in (1, 2, 6):
             # Input goes into v, must be size m
             if x.shape[0] != self.m:
                 raise ValueError(f"Input vector size {x.shape[0]} does not match matrix rows {self.m}")
-            v = x.copy()
-        elif mode in [3, 5]:
+            v = x if inplace else self._v
+            if v is not x:
+                ctypes.memmove(v.ctypes.data, x.ctypes.data, x.nbytes)
+            if mode == 6 and out is not None:
+                self._check_out(out, self.n)
+                w = out
+            else:
+                w = self._w
+            if mode == 6:
+                # The pure L products (modes 1, 2) never touch w
+                w.fill(0.0)
+        elif mode in (3, 5):
             # Input goes into w, must be size n
             if x.shape[0] != self.n:
                 raise ValueError(f"Input vector size {x.shape[0]} does not match matrix columns {self.n}")
-            w = x.copy()
+            w = x if inplace else self._w
+            if w is not x:
+                ctypes.memmove(w.ctypes.data, x.ctypes.data, x.nbytes)
+            if out is not None:
+                self._check_out(out, self.m)
+                v = out
+            else:
+                v = self._v
+            v.fill(0.0)
         elif mode == 4:
             # Special case: input is size m, goes into both v and w
             # According to Matlab: v = w (but input x is size m)
             if x.shape[0] != self.m:
                 raise ValueError(f"Input vector size {x.shape[0]} does not match matrix rows {self.m}")
-            v = x.copy()
-        
-        _clusol.clu6mul(
-            ctypes.byref(ctypes.c_int64(mode)),
-            ctypes.byref(ctypes.c_int64(self.m)),
-            ctypes.byref(ctypes.c_int64(self.n)),
-            v.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            w.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            ctypes.byref(ctypes.c_int64(self.lena)),
-            self.luparm.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.parmlu.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            self.a.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            self.indc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.indr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.p.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.q.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.lenc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.lenr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.locc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.locr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64))
-        )
-        
-        # Return appropriate output based on mode
-        if mode in [1, 2, 3, 5]:
-            # Output is in v
-            return v
-        else:  # mode in [4, 6]
-            # Output is in w
-            return w
+            v = x if inplace else self._v
+            if v is not x:
+                ctypes.memmove(v.ctypes.data, x.ctypes.data, x.nbytes)
+            if out is not None:
+                self._check_out(out, self.n)
+                w = out
+            else:
+                w = self._w
+            w.fill(0.0)
+        else:
+            raise ValueError(f"Invalid mode {mode}. Must be 1-6.")
+
+        if _clusol_cy is not None:
+            _clusol_cy.clu6mul(mode, self.m, self.n, v, w, self.lena,
+                               self.luparm, self.parmlu, self.a,
+                               self.indc, self.indr, self.p, self.q,
+                               self.lenc, self.lenr, self.locc, self.locr)
+        else:
+            self._c_mode.value = mode
+            clusol.clu6mul(self._b_mode, self._b_m, self._b_n, v, w,
+                           *self._arg_tail)
+
+
+        # Output is in v for modes 1, 2, 3, 5 and in w for modes 4, 6;
+        # copy it out of the workspace unless it already sits in a
+        # caller-owned buffer
+        result = v if mode in (1, 2, 3, 5) else w
+
+        if out is not None:
+            if result is not out:
+                self._check_out(out, result.shape[0])
+                np.copyto(out, result)
+            return out
+        if inplace and result is x:
+            return result
+        return result.copy()
     
     def repcol(self, v, jrep, mode1=2, mode2=2):
         """
@@ -317,38 +943,260 @@ class LUSOL:
             Status code
         """
         v = np.asarray(v, dtype=np.float64)
-        w = np.zeros(self.m, dtype=np.float64)
-        inform = ctypes.c_int64(0)
-        diag = ctypes.c_double(0.0)
-        vnorm = ctypes.c_double(0.0)
-        
-        _clusol.clu8rpc(
-            ctypes.byref(ctypes.c_int64(mode1)),
-            ctypes.byref(ctypes.c_int64(mode2)),
-            ctypes.byref(ctypes.c_int64(self.m)),
-            ctypes.byref(ctypes.c_int64(self.n)),
-            ctypes.byref(ctypes.c_int64(jrep)),
-            v.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            w.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            ctypes.byref(ctypes.c_int64(self.lena)),
-            self.luparm.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.parmlu.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            self.a.ctypes.data_as(ctypes.POINTER(ctypes.c_double)),
-            self.indc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.indr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.p.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.q.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.lenc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.lenr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.locc.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            self.locr.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
-            ctypes.byref(inform),
-            ctypes.byref(diag),
-            ctypes.byref(vnorm)
+        # lu8rpc declares its w argument unused, so the idle solve
+        # scratch stands in without even a clearing pass
+        w = self._v
+        self._c_inform.value = 0
+
+        if _clusol_cy is not None:
+            inform, _, _ = _clusol_cy.clu8rpc(
+                mode1, mode2, self.m, self.n, jrep, v, w, self.lena,
+                self.luparm, self.parmlu, self.a,
+                self.indc, self.indr, self.p, self.q,
+                self.lenc, self.lenr, self.locc, self.locr)
+            self._c_inform.value = inform
+            self._band = None
+            self._band_t = None
+            return inform
+
+        self._c_mode1.value = mode1
+        self._c_mode2.value = mode2
+        self._c_j.value = jrep
+        clusol.clu8rpc(
+            self._b_mode1,
+            self._b_mode2,
+            self._b_m,
+            self._b_n,
+            self._b_j,
+            v,
+            w,
+            *self._arg_tail,
+            self._b_inform,
+            self._b_diag,
+            self._b_vnorm
         )
-        
-        return inform.value
-    
+
+        # The banded shortcut no longer matches the updated factors
+        self._band = None
+        self._band_t = None
+
+        return self._c_inform.value
+
+    def reprow(self, w_new, irep, mode1=1, mode2=1):
+        """
+        Replace a row in the factorization
+
+        Implemented by LUSOL as a rank-one modification of the existing
+        factors, so repeated row changes cost O(nnz of the factors) each
+        instead of the full refactorization a new LUSOL(A) would run.
+
+        Parameters
+        ----------
+        w_new : array_like
+            New row vector (length n)
+        irep : int
+            Row index to replace (1-indexed)
+        mode1 : int, optional
+            How the old row is obtained (default 1: computed from the
+            factors; see lu8rpr in src/lusol8b.f for the other modes)
+        mode2 : int, optional
+            Whether w_new holds the new row (default 1) or the new row
+            is zero (0)
+
+        Returns
+        -------
+        inform : int
+            Status code (-1/0/+1: rank decreased/unchanged/increased)
+        """
+        w_new = np.ascontiguousarray(w_new, dtype=np.float64)
+        if w_new.shape[0] != self.n:
+            raise ValueError(f"Row vector size {w_new.shape[0]} does not match matrix columns {self.n}")
+        # Work arrays for the update; the persistent solve scratch is
+        # idle here and has the right lengths
+        v = self._v
+        v.fill(0.0)
+        w = self._w
+        w.fill(0.0)
+        self._c_inform.value = 0
+        self._c_mode1.value = mode1
+        self._c_mode2.value = mode2
+        self._c_j.value = irep
+
+        clusol.clu8rpr(
+            self._b_mode1,
+            self._b_mode2,
+            self._b_m,
+            self._b_n,
+            self._b_j,
+            v,
+            w,
+            w_new,
+            *self._arg_tail,
+            self._b_inform
+        )
+
+        self._band = None
+        self._band_t = None
+
+        return self._c_inform.value
+
+    def addcol(self, v, mode=1):
+        """
+        Append a new last column to the factorization
+
+        The dimension grows from n to n+1; the n-sized workspaces are
+        reallocated with the factor state carried over, which is still
+        far cheaper than refactorizing.
+
+        Parameters
+        ----------
+        v : array_like
+            New column vector (length m); overwritten with y solving
+            L*y = v
+        mode : int, optional
+            1 if v holds the new column (default), 2 if v already holds
+            y satisfying L*y = v
+
+        Returns
+        -------
+        inform : int
+            Status code (0: rank unchanged, 1: rank increased)
+        """
+        v = np.ascontiguousarray(v, dtype=np.float64)
+        if v.shape[0] != self.m:
+            raise ValueError(f"Column vector size {v.shape[0]} does not match matrix rows {self.m}")
+        self._grow_columns()
+        self._c_inform.value = 0
+        self._c_mode1.value = mode
+
+        clusol.clu8adc(
+            self._b_mode1,
+            self._b_m,
+            self._b_n,
+            v,
+            self._w,
+            *self._arg_tail,
+            self._b_inform,
+            self._b_diag,
+            self._b_vnorm
+        )
+
+        self._band = None
+        self._band_t = None
+
+        return self._c_inform.value
+
+    def delcol(self, jdel):
+        """
+        Delete a column from the factorization
+
+        The dimension shrinks from n to n-1 and the columns to the
+        right shift one place left. Replacing the column with zeros via
+        repcol can be cheaper when the position need not change.
+
+        Parameters
+        ----------
+        jdel : int
+            Column index to delete (1-indexed)
+
+        Returns
+        -------
+        inform : int
+            Status code (-1: rank decreased, 0: rank unchanged)
+        """
+        self._c_inform.value = 0
+        self._c_j.value = jdel
+
+        clusol.clu8dlc(
+            self._b_m,
+            self._b_n,
+            self._b_j,
+            *self._arg_tail,
+            self._b_inform
+        )
+
+        if self._c_inform.value in (-1, 0):
+            self.n -= 1
+            self._c_n.value = self.n
+            # Keep the persistent solve workspace at the new length so
+            # solve() returns n-vectors
+            self._w = self._w[:self.n]
+
+        self._band = None
+        self._band_t = None
+
+        return self._c_inform.value
+
+    def mod(self, beta, v, w, mode=1):
+        """
+        Apply the rank-one modification A + beta * v * w' to the factors
+
+        Parameters
+        ----------
+        beta : float
+            Scalar multiplier
+        v : array_like
+            Column vector (length m); overwritten with y solving L*y = v
+        w : array_like
+            Row vector (length n); not altered
+        mode : int, optional
+            1 if v holds the vector v (default), 2 if v already holds
+            y satisfying L*y = v
+
+        Returns
+        -------
+        inform : int
+            Status code (-1/0/+1: rank decreased/unchanged/increased)
+        """
+        v = np.ascontiguousarray(v, dtype=np.float64)
+        w = np.ascontiguousarray(w, dtype=np.float64)
+        if v.shape[0] != self.m:
+            raise ValueError(f"Column vector size {v.shape[0]} does not match matrix rows {self.m}")
+        if w.shape[0] != self.n:
+            raise ValueError(f"Row vector size {w.shape[0]} does not match matrix columns {self.n}")
+        self._c_inform.value = 0
+        self._c_mode1.value = mode
+        self._c_beta.value = beta
+
+        clusol.clu8mod(
+            self._b_mode1,
+            self._b_m,
+            self._b_n,
+            self._b_beta,
+            v,
+            w,
+            *self._arg_tail,
+            self._b_inform
+        )
+
+        self._band = None
+        self._band_t = None
+
+        return self._c_inform.value
+
+    def _grow_columns(self):
+        """Reallocate the workspaces with room for one more column
+
+        addcol raises n by one, and the n-sized arrays (q, lenc, locc,
+        ...) are carved out of a fixed slab, so the slab is rebuilt for
+        the new n and the factor state copied across. The factor data
+        itself (a/indc/indr, luparm/parmlu) keeps its size.
+        """
+        old_views = (self.indc, self.indr, self.p, self.q,
+                     self.lenc, self.lenr, self.locc, self.locr,
+                     self.iploc, self.iqloc, self.ipinv, self.iqinv)
+        old_a = self.a
+        self.n += 1
+        self._c_n.value = self.n
+        self._allocate_workspaces()
+        for dst, src in zip((self.indc, self.indr, self.p, self.q,
+                             self.lenc, self.lenr, self.locc, self.locr,
+                             self.iploc, self.iqloc, self.ipinv,
+                             self.iqinv), old_views):
+            dst[:src.size] = src
+        self.a[:] = old_a
+        self._cache_call_args()
+
     def get_stats(self):
         """
         Get factorization statistics
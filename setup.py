@@ -5,8 +5,123 @@ Setup script for PyLUSOL
 Python interface to LUSOL sparse matrix factorization library
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+from setuptools.command.build_py import build_py
+from setuptools.command.build_ext import build_ext
 import os
+import re
+import sys
+
+# Scalar (pass-by-reference) parameter names in the clusol interface.
+# Everything else declared in src/clusol.h is an array. Used to generate
+# the ctypes signature table at build time.
+SCALAR_PARAMS = {
+    'mode', 'mode1', 'mode2', 'm', 'n', 'nelem', 'lena', 'nrhs',
+    'jrep', 'irep', 'jdel', 'idel', 'inform', 'diag', 'vnorm', 'beta',
+}
+
+PROTO_RE = re.compile(r'void\s+(clu\w+)\s*\(([^)]*)\)', re.S)
+
+
+def parse_signatures(*sources):
+    """Extract per-argument signature strings from the C interface files
+
+    Each argument becomes one character, matching the encoding used in
+    pylusol.clusol: 'P'/'d' for int64/double arrays, 'i'/'x' for scalar
+    int64/double passed by reference.
+    """
+    sigs = {}
+    for source in sources:
+        with open(source) as f:
+            text = f.read()
+        for name, args in PROTO_RE.findall(text):
+            codes = []
+            for arg in args.split(','):
+                ctype, pname = arg.rsplit('*', 1)
+                scalar = pname.strip() in SCALAR_PARAMS
+                if 'int64_t' in ctype:
+                    codes.append('i' if scalar else 'P')
+                else:
+                    codes.append('x' if scalar else 'd')
+            sigs[name] = ''.join(codes)
+    return sigs
+
+
+def write_argtypes(out_path):
+    """Generate pylusol/_argtypes.py from the C interface files"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    sigs = parse_signatures(os.path.join(here, 'src', 'clusol.h'),
+                            os.path.join(here, 'src', 'clusol_batch.c'))
+    with open(out_path, 'w') as f:
+        f.write('"""Generated by setup.py from src/clusol.h -- do not edit"""\n\n')
+        f.write('SIGS = {\n')
+        for name in sorted(sigs):
+            f.write(f'    "{name}": "{sigs[name]}",\n')
+        f.write('}\n')
+
+
+def cython_extensions():
+    """Build the optional Cython speedup module when Cython is available
+
+    The package is fully functional over ctypes; the Cython binding
+    just removes per-call marshaling overhead on the hot entry points.
+    No Cython, no extension.
+    """
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+    ext = Extension(
+        'pylusol._clusol_cy',
+        ['pylusol/_clusol_cy.pyx'],
+        include_dirs=['src'],
+        libraries=['clusol'],
+        library_dirs=['pylusol/lib', 'src'],
+        runtime_library_dirs=[] if sys.platform == 'win32' else ['$ORIGIN/lib'],
+    )
+    # OpenMP for the prange batch solve; only where gcc is the norm
+    # (Apple clang rejects -fopenmp, and prange degrades to a serial
+    # loop without it)
+    if sys.platform.startswith('linux'):
+        ext.extra_compile_args = ['-fopenmp']
+        ext.extra_link_args = ['-fopenmp']
+    return cythonize([ext], language_level=3)
+
+
+class OptionalBuildExt(build_ext):
+    """build_ext that treats the Cython speedup module as best-effort
+
+    A missing C toolchain or libclusol must not break installation;
+    pylusol falls back to the ctypes binding at runtime.
+    """
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as e:
+            print(f"warning: skipping optional Cython extension: {e}")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            print(f"warning: skipping optional extension {ext.name}: {e}")
+
+
+class BuildPyWithArgtypes(build_py):
+    """build_py that regenerates the ctypes signature table first
+
+    Deriving the table from src/clusol.h at build time keeps the Python
+    bindings in lockstep with the C interface: signature drift becomes a
+    build-time diff instead of a silent miscall at runtime.
+    """
+
+    def run(self):
+        here = os.path.dirname(os.path.abspath(__file__))
+        if os.path.exists(os.path.join(here, 'src', 'clusol.h')):
+            write_argtypes(os.path.join(here, 'pylusol', '_argtypes.py'))
+        super().run()
+
 
 # Read long description from README
 long_description = """
@@ -86,8 +201,14 @@ setup(
     author_email='',
     url='https://github.com/kaustubhroy1995/lusol',
     packages=find_packages(),
+    cmdclass={'build_py': BuildPyWithArgtypes, 'build_ext': OptionalBuildExt},
+    ext_modules=cython_extensions(),
     package_data={
-        'pylusol': ['lib/*.so', 'lib/*.dylib', 'lib/*.dll'],
+        'pylusol': [
+            'lib/*.so', 'lib/*.dylib', 'lib/*.dll',
+            # per-architecture library directories, e.g. lib/linux_x86_64
+            'lib/*/*.so', 'lib/*/*.dylib', 'lib/*/*.dll',
+        ],
     },
     python_requires='>=3.6',
     install_requires=[
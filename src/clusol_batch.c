@@ -0,0 +1,41 @@
+// Hand-written companion to the generated clusol.c (not produced by
+// gen/interface.py).
+
+#include "clusol.h"
+
+// Batch variant of clu6sol: solve nrhs systems with one library call,
+// looping over the right-hand sides in C so callers do not pay the
+// foreign-call overhead per column. v holds nrhs vectors of length m
+// stored back to back; w holds nrhs vectors of length n. Stops at the
+// first nonzero inform.
+void clu6sol_batch(
+  int64_t* mode,
+  int64_t* m,
+  int64_t* n,
+  int64_t* nrhs,
+  double* v,
+  double* w,
+  int64_t* lena,
+  int64_t* luparm,
+  double* parmlu,
+  double* a,
+  int64_t* indc,
+  int64_t* indr,
+  int64_t* p,
+  int64_t* q,
+  int64_t* lenc,
+  int64_t* lenr,
+  int64_t* locc,
+  int64_t* locr,
+  int64_t* inform) {
+  int64_t j;
+  *inform = 0;
+  for (j = 0; j < *nrhs; j++) {
+    clu6sol(mode, m, n, v + j * *m, w + j * *n,
+            lena, luparm, parmlu, a, indc, indr, p, q,
+            lenc, lenr, locc, locr, inform);
+    if (*inform != 0) {
+      return;
+    }
+  }
+}